@@ -0,0 +1,62 @@
+import logging
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+
+log = logging.getLogger(__name__)
+
+
+def register_vector_types(sender, connection, **kwargs):
+    """
+    Registers the pgvector types on a new database connection, so that vectors are loaded by the
+    database driver and `Vector` objects or numpy arrays can be sent as parameters, including
+    in binary mode.
+
+    The ORM does not need this, so it is only connected to `connection_created` when the
+    `DJANGO_HAYSTACK_REGISTER_VECTOR_TYPES` setting is enabled. Registering costs a catalog query
+    per vector type on every new connection.
+    """
+    if connection.vendor != "postgresql":
+        return
+
+    if connection.Database.__name__ == "psycopg2":
+        from pgvector.psycopg2 import register_vector
+    else:
+        from pgvector.psycopg import register_vector
+
+    try:
+        register_vector(connection.connection)
+    except connection.Database.ProgrammingError:
+        # The vector extension does not exist yet, e.g. before migrations have been applied
+        log.debug("Skipped registering pgvector types on connection '%s'", connection.alias)
+
+
+def register_vector_types_after_migrate(sender, using, **kwargs):
+    """
+    Registers the pgvector types on a connection that was opened before migrations created the
+    vector extension, such as the connection used to create a test database.
+    """
+    connection = connections[using]
+    if connection.connection is not None:
+        register_vector_types(sender, connection)
+
+
+class DjangoHaystackConfig(AppConfig):
+    name = "django_haystack"
+    verbose_name = "Django Haystack"
+
+    def ready(self):
+        if not getattr(settings, "DJANGO_HAYSTACK_REGISTER_VECTOR_TYPES", False):
+            return
+
+        connection_created.connect(
+            register_vector_types, dispatch_uid="django_haystack.register_vector_types"
+        )
+        post_migrate.connect(
+            register_vector_types_after_migrate,
+            sender=self,
+            dispatch_uid="django_haystack.register_vector_types_after_migrate",
+        )
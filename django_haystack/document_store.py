@@ -1,17 +1,31 @@
 import logging
-from typing import Any, Dict, List
+import math
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List
+from weakref import WeakValueDictionary
 
 from django.apps import apps
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db import models, transaction
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorExact,
+)
+from django.db import IntegrityError, connections, models, router, transaction
 from django.db.models import ExpressionWrapper, F, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Sqrt
 from haystack.dataclasses.document import Document
 from haystack.document_stores.errors import DuplicateDocumentError
 from haystack.document_stores.types import DuplicatePolicy
+from pgvector import Vector
+from pgvector.django import HalfVectorField
 from pgvector.django.functions import (
     BitDistanceBase,
     CosineDistance,
     DistanceBase,
+    HammingDistance,
     L1Distance,
     L2Distance,
     MaxInnerProduct,
@@ -21,16 +35,65 @@ from django_haystack.models import HaystackDocumentStoreModel, HaystackDocumentS
 
 log = logging.getLogger(__name__)
 
+# Maximum number of rows sent in a single INSERT statement by `write_documents()`
+WRITE_BATCH_SIZE = 1000
+
+# Minimum number of documents for `write_documents()` to overwrite documents with `COPY`
+COPY_THRESHOLD = 5000
+
+# Number of rows fetched per round-trip when streaming results in `filter_documents()`
+FILTER_CHUNK_SIZE = 2000
+
+# Number of candidates per requested document preselected by binary quantized embeddings
+BINARY_RERANK_FACTOR = 10
+
+# Maximum number of ids `embedding_retrieval(prefilter=True)` inlines into the query, one parameter
+# each. When more documents match, the filters are applied with a subquery instead.
+PREFILTER_MAX_IDS = 10000
+
+
+class SquaredL2Distance(DistanceBase):
+    """
+    The squared Euclidean distance. It ranks vectors like `L2Distance` without taking a square
+    root per row, but no pgvector index operator class supports it.
+    """
+
+    function = "vector_l2_squared_distance"
+
+
+# Converts a distance into the `score` of the retrieved documents, per vector function. Cosine
+# and inner product scores are similarities, so that a higher score is better. Other distances
+# are used as is.
+_SCORE_EXPRESSIONS = {
+    CosineDistance: lambda distance: Value(1.0) - distance,
+    MaxInnerProduct: lambda distance: -distance,
+    L1Distance: lambda distance: distance,
+    L2Distance: lambda distance: distance,
+    SquaredL2Distance: lambda distance: Sqrt(distance),
+}
+
+
+def _get_score_expression(vector_function, distance):
+    return _SCORE_EXPRESSIONS.get(vector_function, lambda distance: distance)(distance)
+
 
 class DjangoModelDocumentStore:
     """
     Haystack Document store using a Django model as the backend to store Haystack documents.
     """
 
+    #: Haystack fields left out of keyword retrieval, as they are not needed to rank by keywords
+    #: and are costly to transfer.
+    keyword_retrieval_exclude = ("embedding",)
+
+    # Instances shared by `get_or_create()`, keyed by class and init arguments
+    _registry: "WeakValueDictionary[tuple, DjangoModelDocumentStore]" = WeakValueDictionary()
+
     def __init__(
         self,
         model: type[HaystackDocumentStoreModel],
         language: str = "english",
+        assume_normalized: bool = False,
     ):
         """
         Creates a new DjangoModelDocumentStore instance.
@@ -38,20 +101,51 @@ class DjangoModelDocumentStore:
         :param: model: The Django model to use as the document store. This model must be a subclass
                        of `HaystackDocumentStoreModel`.
         :param language: The language used for keyword-based retrieval.
+        :param assume_normalized: Whether all embeddings, stored and queried, have unit length.
+                                  Cosine distance then ranks documents exactly like the inner
+                                  product, so `CosineDistance` retrievals use the cheaper
+                                  `MaxInnerProduct` operator, with the same scores. Index the
+                                  embeddings with `vector_ip_ops` to match.
         """
         self.model = model
         self.language = language or model._haystack.language
+        self.assume_normalized = assume_normalized
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "model": (self.model._meta.app_label, self.model._meta.model_name),
             "language": self.language,
+            "assume_normalized": self.assume_normalized,
         }
 
+    @classmethod
+    def get_or_create(
+        cls,
+        model: type[HaystackDocumentStoreModel],
+        language: str = "english",
+        assume_normalized: bool = False,
+    ) -> "DjangoModelDocumentStore":
+        """
+        Returns a document store for `model`, reusing an existing instance created with the same
+        arguments while it is still referenced.
+        """
+        key = (cls, model, language, assume_normalized)
+        document_store = cls._registry.get(key)
+        if document_store is None:
+            document_store = cls(
+                model=model, language=language, assume_normalized=assume_normalized
+            )
+            cls._registry[key] = document_store
+        return document_store
+
     @classmethod
     def from_dict(cls, config: dict[str, Any]) -> "DjangoModelDocumentStore":
         model = apps.get_model(*config["model"])
-        return cls(model=model, language=config.get("language"))
+        return cls.get_or_create(
+            model=model,
+            language=config.get("language"),
+            assume_normalized=config.get("assume_normalized", False),
+        )
 
     def count_documents(self) -> int:
         """
@@ -76,12 +170,47 @@ class DjangoModelDocumentStore:
         :raises ValueError: If `filters` is not a dictionary.
         :returns: A list of Documents that match the given filters.
         """
+        # Rows are read as dicts rather than model instances, as only the field values are needed
+        rows = (
+            self._get_filtered_queryset(filters)
+            .values(*self.model._haystack.get_field_names())
+            .iterator(chunk_size=FILTER_CHUNK_SIZE)
+        )
+
+        return self._rows_to_documents(rows)
+
+    def count_filtered(self, filters: dict[str, Any] = None) -> int:
+        """
+        Returns the number of documents that match the filters provided.
+
+        The count is computed by the database, so this is much cheaper than
+        `len(filter_documents(filters))` when the documents themselves are not needed.
+
+        :param filters: The filters to apply to the document list.
+        :returns: The number of documents that match the given filters.
+        """
+        return self._get_filtered_queryset(filters).count()
+
+    def filter_document_ids(self, filters: dict[str, Any] = None) -> list[str]:
+        """
+        Returns the ids of the documents that match the filters provided.
+
+        Only the id column is selected, so neither content nor embeddings are transferred from the
+        database.
+
+        :param filters: The filters to apply to the document list.
+        :returns: A list of ids of the documents that match the given filters.
+        """
+        id_field = self.model._haystack.field_map["id"]
+        return list(self._get_filtered_queryset(filters).values_list(id_field, flat=True))
+
+    def _get_filtered_queryset(self, filters: dict[str, Any] = None):
         queryset = self.get_queryset()
 
         if filters:
             queryset = queryset.apply_haystack_filters(filters)
 
-        return [obj.to_haystack_document() for obj in queryset]
+        return queryset
 
     def write_documents(
         self,
@@ -91,36 +220,207 @@ class DjangoModelDocumentStore:
         """
         Writes or overwrites documents into the model.
 
+        When overwriting more than `COPY_THRESHOLD` documents on psycopg 3, the documents are
+        written with `write_documents_bulk_copy()`.
+
         :param documents: A list of documents to write to the model.
         :param policy: The duplicate policy to use when writing documents.
         :return: The number of documents written.
         """
-        num_written = 0
+        if policy == DuplicatePolicy.NONE:
+            policy = DuplicatePolicy.FAIL
+
+        if (
+            policy == DuplicatePolicy.OVERWRITE
+            and len(documents) > COPY_THRESHOLD
+            and self._supports_copy(connections[router.db_for_write(self.model)])
+        ):
+            return self.write_documents_bulk_copy(documents, policy=policy)
+
+        id_field = self.model._haystack.field_map["id"]
+        db_docs = [self.model.from_haystack_document(document) for document in documents]
+
+        if not db_docs:
+            return 0
+
+        if policy == DuplicatePolicy.OVERWRITE:
+            # The last occurrence of an id wins, as ON CONFLICT cannot update a row twice
+            db_docs = list({getattr(db_doc, id_field): db_doc for db_doc in db_docs}.values())
+            update_fields = [
+                field.name
+                for field in self.model._meta.concrete_fields
+                if not field.primary_key
+                and field.name != id_field
+                and not getattr(field, "generated", False)
+            ]
+            self.model.objects.bulk_create(
+                db_docs,
+                batch_size=WRITE_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=[id_field],
+                update_fields=update_fields,
+            )
+            return len(db_docs)
+
+        existing = set(
+            self.model.objects.filter(
+                **{f"{id_field}__in": [getattr(db_doc, id_field) for db_doc in db_docs]}
+            ).values_list(id_field, flat=True)
+        )
+
+        new_docs = []
+        for db_doc in db_docs:
+            doc_id = getattr(db_doc, id_field)
+            if doc_id in existing:
+                if policy == DuplicatePolicy.FAIL:
+                    raise DuplicateDocumentError(f"Duplicate document found for id {doc_id}")
+                continue
+            existing.add(doc_id)
+            new_docs.append(db_doc)
+
+        self.model.objects.bulk_create(
+            new_docs,
+            batch_size=WRITE_BATCH_SIZE,
+            ignore_conflicts=policy == DuplicatePolicy.SKIP,
+        )
+
+        return len(new_docs)
+
+    def write_documents_bulk_copy(
+        self,
+        documents: list[Document],
+        policy: DuplicatePolicy = DuplicatePolicy.NONE,
+    ) -> int:
+        """
+        Writes or overwrites documents into the model using Postgres `COPY`.
+
+        Rows are streamed to the database instead of being sent as INSERT statements, which is
+        considerably faster for large ingests. With the SKIP and OVERWRITE policies, documents
+        are copied to a temporary table and then merged with `INSERT ... ON CONFLICT`.
+
+        Requires psycopg 3; with other database drivers, `write_documents()` is used instead.
+
+        :param documents: A list of documents to write to the model.
+        :param policy: The duplicate policy to use when writing documents.
+        :return: The number of documents written.
+        """
+        connection = connections[router.db_for_write(self.model)]
+        if not self._supports_copy(connection):
+            return self.write_documents(documents, policy=policy)
 
         if policy == DuplicatePolicy.NONE:
             policy = DuplicatePolicy.FAIL
 
-        with transaction.atomic():
-            for document in documents:
-                lookup = {self.model._haystack.field_map["id"]: document.id}
-                try:
-                    existing = self.model.objects.get(**lookup)
-                except self.model.DoesNotExist:
-                    existing = None
-
-                if existing and policy == DuplicatePolicy.OVERWRITE:
-                    existing.delete()
-                elif existing and policy == DuplicatePolicy.FAIL:
-                    raise DuplicateDocumentError(f"Duplicate document found for id {document.id}")
-                elif existing and policy == DuplicatePolicy.SKIP:
-                    continue
-
-                db_doc = self.model.from_haystack_document(document)
-                db_doc.save()
-                num_written += 1
+        opts = self.model._meta
+        id_field = opts.get_field(self.model._haystack.field_map["id"])
+        db_docs = [self.model.from_haystack_document(document) for document in documents]
+
+        if not db_docs:
+            return 0
+
+        if policy == DuplicatePolicy.OVERWRITE:
+            # The last occurrence of an id wins, as ON CONFLICT cannot update a row twice
+            db_docs = list(
+                {getattr(db_doc, id_field.attname): db_doc for db_doc in db_docs}.values()
+            )
+
+        quote_name = connection.ops.quote_name
+        fields = [
+            field for field in opts.concrete_fields if not getattr(field, "generated", False)
+        ]
+        # (fields, documents) pairs, each copied with its own column list
+        batches = [(fields, db_docs)]
+        if opts.pk.db_returning:
+            # Like `bulk_create()`, leave unset auto primary keys out of the copied columns, so
+            # that the column default fills them rather than an explicit NULL
+            batches = [
+                (fields, [db_doc for db_doc in db_docs if db_doc.pk is not None]),
+                (
+                    [field for field in fields if not field.primary_key],
+                    [db_doc for db_doc in db_docs if db_doc.pk is None],
+                ),
+            ]
+        table = quote_name(opts.db_table)
+        staging_table = quote_name(f"{opts.db_table}_copy")
+
+        num_written = 0
+        try:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                for batch_fields, batch_docs in batches:
+                    if not batch_docs:
+                        continue
+
+                    if policy == DuplicatePolicy.FAIL:
+                        self._copy_rows(cursor, table, batch_fields, batch_docs)
+                        num_written += len(batch_docs)
+                        continue
+
+                    columns = ", ".join(quote_name(field.column) for field in batch_fields)
+                    # Stage only the copied columns: `LIKE` would also copy the NOT NULL primary
+                    # key column, which is left out for documents without a primary key
+                    cursor.execute(
+                        f"CREATE TEMPORARY TABLE {staging_table} ON COMMIT DROP "
+                        f"AS SELECT {columns} FROM {table} WITH NO DATA"  # noqa: S608
+                    )
+                    self._copy_rows(cursor, staging_table, batch_fields, batch_docs)
+
+                    if policy == DuplicatePolicy.OVERWRITE:
+                        on_conflict = "DO UPDATE SET " + ", ".join(
+                            f"{quote_name(field.column)} = EXCLUDED.{quote_name(field.column)}"
+                            for field in batch_fields
+                            if not field.primary_key and field != id_field
+                        )
+                    else:
+                        on_conflict = "DO NOTHING"
+
+                    cursor.execute(
+                        f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging_table} "  # noqa: S608
+                        f"ON CONFLICT ({quote_name(id_field.column)}) {on_conflict}"
+                    )
+                    num_written += cursor.rowcount
+                    cursor.execute(f"DROP TABLE {staging_table}")
+        except IntegrityError as e:
+            if policy == DuplicatePolicy.FAIL:
+                raise DuplicateDocumentError(f"Duplicate document found: {e}") from e
+            raise
 
         return num_written
 
+    def _supports_copy(self, connection) -> bool:
+        return connection.vendor == "postgresql" and connection.Database.__name__ == "psycopg"
+
+    def _copy_rows(self, cursor, table: str, fields: list[models.Field], db_docs) -> None:
+        """
+        Streams the field values of the given model instances into `table` with `COPY`.
+        """
+        connection = cursor.db
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        with (
+            connection.wrap_database_errors,
+            cursor.cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy,
+        ):
+            for db_doc in db_docs:
+                copy.write_row(
+                    [
+                        field.get_db_prep_save(getattr(db_doc, field.attname), connection)
+                        for field in fields
+                    ]
+                )
+
+    def _rows_to_documents(self, rows: Iterable[dict[str, Any]]) -> list[Document]:
+        """
+        Converts `QuerySet.values()` rows keyed by model field name into Documents. A `score`
+        key, when present, is used as the Document score.
+        """
+        document_fields = self.model._haystack.document_fields
+        return [
+            self.model.values_to_haystack_document(
+                {name: row[field.name] for name, field in document_fields if field.name in row},
+                score=row.get("score"),
+            )
+            for row in rows
+        ]
+
     def delete_documents(self, document_ids: list[str] = None) -> None:
         """
         Deletes documents that match the provided document_ids.
@@ -129,6 +429,109 @@ class DjangoModelDocumentStore:
         """
         self.model.objects.filter(id__in=document_ids).delete()
 
+    @contextmanager
+    def search_parameters(
+        self,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        using: str | None = None,
+    ) -> Iterator[None]:
+        """
+        Sets the pgvector index search parameters for the queries evaluated within the context.
+
+        The parameters are set with `SET LOCAL` in a transaction, so they do not leak into other
+        queries using the same connection. When the context is entered within a transaction
+        (`ATOMIC_REQUESTS` or an enclosing `atomic()`), `SET LOCAL` lasts until that transaction
+        ends, so the previous values are restored when the context exits. When no parameter is
+        given, no transaction is opened.
+
+        :param ef_search: Size of the candidate list used when scanning an HNSW index
+                          (`hnsw.ef_search`). An HNSW index scan returns at most this many rows.
+        :param probes: Number of lists scanned in an IVFFlat index (`ivfflat.probes`).
+        :param using: Alias of the database the queries are run against.
+        """
+        parameters = {"hnsw.ef_search": ef_search, "ivfflat.probes": probes}
+        parameters = {name: str(value) for name, value in parameters.items() if value}
+        if not parameters:
+            yield
+            return
+
+        using = using or router.db_for_read(self.model)
+        connection = connections[using]
+        in_transaction = connection.in_atomic_block
+        with transaction.atomic(using=using):
+            previous = {}
+            with connection.cursor() as cursor:
+                for name, value in parameters.items():
+                    cursor.execute(
+                        "SELECT current_setting(%s, true), set_config(%s, %s, true)",
+                        [name, name, value],
+                    )
+                    previous[name] = cursor.fetchone()[0]
+            yield
+            if in_transaction:
+                # Only a savepoint is released on exit, which keeps `SET LOCAL` values. On errors,
+                # rolling back the savepoint already reverts them. A NULL value resets the
+                # parameter.
+                with connection.cursor() as cursor:
+                    for name, value in previous.items():
+                        cursor.execute("SELECT set_config(%s, %s, true)", [name, value])
+
+    def _get_vector_function(self, vector_function, query_embeddings: List[List[float]]):
+        """
+        Returns the vector function to rank documents with, defaulting to the one declared on the
+        model's HaystackOptions.
+        """
+        vector_function = vector_function or self.model._haystack.vector_function
+        if vector_function is None:
+            raise ValueError(
+                "A vector_function must be provided or defined on the model's HaystackOptions"
+            )
+
+        if self.assume_normalized and vector_function is CosineDistance:
+            if settings.DEBUG:
+                for query_embedding in query_embeddings:
+                    norm = math.sqrt(sum(value * value for value in query_embedding))
+                    if not math.isclose(norm, 1.0, rel_tol=1e-3):
+                        log.warning(
+                            "Query embedding has norm %s, but the document store assumes "
+                            "normalized embeddings",
+                            norm,
+                        )
+            # For unit vectors the cosine similarity is the inner product, so `<#>` (the negative
+            # inner product) yields the same ranking and scores without computing the norms.
+            return MaxInnerProduct
+
+        return vector_function
+
+    def _get_ranking_function(self, vector_function):
+        """
+        Returns the function to order documents by, which ranks them like `vector_function`.
+        """
+        if (
+            vector_function is L2Distance
+            and self.model._haystack.squared_l2_ranking
+            and self.model._haystack.embedding_type in (None, "vector")
+        ):
+            # The squared distance orders rows the same without a square root per row, but no
+            # index can serve it. The score is still the L2 distance.
+            return SquaredL2Distance
+        return vector_function
+
+    def _get_embedding_expression(self, embedding_field: str) -> F | Cast:
+        """
+        Returns the expression embeddings are compared with, casting the column to `halfvec` when
+        `embedding_type = "halfvec"` is declared on the model's HaystackOptions.
+        """
+        embedding_type = self.model._haystack.embedding_type
+        if embedding_type in (None, "vector"):
+            return F(embedding_field)
+        if embedding_type == "halfvec":
+            dimensions = self.model._meta.get_field(embedding_field).dimensions
+            return Cast(embedding_field, HalfVectorField(dimensions=dimensions))
+        raise ValueError(f"Unsupported embedding_type: {embedding_type}")
+
     def embedding_retrieval(
         self,
         query_embedding: List[float],
@@ -138,6 +541,8 @@ class DjangoModelDocumentStore:
         vector_function: DistanceBase | BitDistanceBase = None,
         embedding_field: str = "embedding",
         queryset=None,
+        prefilter: bool = False,
+        max_distance: float | None = None,
     ) -> HaystackDocumentStoreQuerySet:
         """
         Retrieves documents from the `DjangoModelDocumentStore`, based on their dense embeddings.
@@ -154,42 +559,186 @@ class DjangoModelDocumentStore:
                       queryset from which to retrieve documents. By default, the
                       document_store.get_queryset() method is used.
         :param vector_function: one of the vector functions from `pgvector.django.functions`
+        :param prefilter: Resolve `filters` with a separate query before ranking, so that only
+                          the matching documents are compared to `query_embedding`. Use this
+                          when the filters are selective (and ideally backed by an index). The
+                          query runs when the queryset is built, outside `search_parameters()`.
+                          When more than `PREFILTER_MAX_IDS` documents match, the filters are
+                          applied with a subquery instead.
+        :param max_distance: Only return documents within this distance of `query_embedding`, as
+                             measured by `vector_function`. The bound is added to the WHERE clause,
+                             which also helps the planner choose an index scan.
 
         :returns: HaystackDocumentStoreQuerySet with a `score` annotation ranked by similarity to
         `query_embedding`
 
         """
-        vector_function = vector_function or self.model._haystack.vector_function
-        if vector_function is None:
-            raise ValueError(
-                "A vector_function must be provided or defined on the model's HaystackOptions"
-            )
+        requested_vector_function = vector_function or self.model._haystack.vector_function
+        vector_function = self._get_vector_function(vector_function, [query_embedding])
+        if (
+            max_distance is not None
+            and requested_vector_function is CosineDistance
+            and vector_function is MaxInnerProduct
+        ):
+            # With normalized embeddings, the cosine distance is 1 + the negative inner product
+            max_distance -= 1
+
+        vector_function = self._get_ranking_function(vector_function)
+        if max_distance is not None and vector_function is SquaredL2Distance:
+            max_distance **= 2
 
         if queryset is None:
             queryset = self.get_queryset()
 
-        score_expression = vector_function(F(embedding_field), query_embedding)
-        if vector_function is CosineDistance:
-            score_expression = Value("1") - score_expression
-        elif vector_function is MaxInnerProduct:
-            score_expression = score_expression * Value("-1")
+        queryset = queryset.only(*self.model._haystack.get_field_names())
+
+        if filters and prefilter:
+            # Resolving the matching rows up front keeps Postgres from choosing an index scan
+            # that is then post-filtered, which can return far fewer than `top_k` documents or
+            # fall back to a sequential scan when the filters are selective.
+            matching = queryset.apply_haystack_filters(filters).values_list("pk", flat=True)
+            pks = list(matching[: PREFILTER_MAX_IDS + 1])
+            if len(pks) > PREFILTER_MAX_IDS:
+                queryset = queryset.filter(pk__in=matching)
+            else:
+                queryset = queryset.filter(pk__in=pks)
+        elif filters:
+            queryset = queryset.apply_haystack_filters(filters)
 
-        score_expression = ExpressionWrapper(score_expression, output_field=models.FloatField())
+        binary_embedding_field = self.model._haystack.binary_embedding_field
+        if binary_embedding_field and top_k:
+            # Preselect candidates by hamming distance over the binary quantized embeddings,
+            # which is far cheaper to scan, then rerank them with the full embeddings below.
+            query_bits = "".join("1" if value > 0 else "0" for value in query_embedding)
+            bit_length = self.model._meta.get_field(binary_embedding_field).length
+            if bit_length is not None and bit_length != len(query_bits):
+                raise ValueError(
+                    f"The query embedding has {len(query_bits)} dimensions, but "
+                    f"'{binary_embedding_field}' holds {bit_length} bits"
+                )
+            candidates = queryset.annotate(
+                _hamming_distance=HammingDistance(F(binary_embedding_field), query_bits)
+            ).order_by("_hamming_distance")[: top_k * BINARY_RERANK_FACTOR]
+            queryset = queryset.filter(pk__in=candidates.values("pk"))
+
+        queryset = queryset.annotate(
+            _distance=vector_function(
+                self._get_embedding_expression(embedding_field), query_embedding
+            )
+        )
 
-        queryset = queryset.annotate(score=score_expression)
+        if max_distance is not None:
+            queryset = queryset.filter(_distance__lte=max_distance)
 
-        if vector_function in {L1Distance, L2Distance}:
-            queryset = queryset.order_by("score")
-        queryset = queryset.order_by("-score")
+        score_expression = ExpressionWrapper(
+            _get_score_expression(vector_function, F("_distance")),
+            output_field=models.FloatField(),
+        )
 
-        if filters:
-            queryset = queryset.apply_haystack_filters(filters)
+        # Closest documents come first for every pgvector operator (`<#>` is the negative inner
+        # product). Ordering by the `_distance` column rather than the derived `score` lets
+        # Postgres use an HNSW/IVFFlat index scan instead of sorting every row.
+        queryset = queryset.annotate(score=score_expression).order_by("_distance")
 
         if top_k:
             queryset = queryset[:top_k]
 
         return queryset
 
+    def embedding_retrieval_batch(
+        self,
+        query_embeddings: List[List[float]],
+        *,
+        filters: Dict[str, Any] = None,
+        top_k: int = 10,
+        vector_function: DistanceBase = None,
+        embedding_field: str = "embedding",
+        queryset=None,
+    ) -> list[list[Document]]:
+        """
+        Retrieves documents for several query embeddings in a single query.
+
+        Each query embedding is joined laterally against the document table, so Postgres runs
+        one ranked (and index-eligible) search per embedding without a round-trip for each.
+
+        :param query_embeddings: Query embeddings to use for the document search.
+        :param filters: Filters applied to the retrieved Documents.
+        :param top_k: Maximum number of Documents to return per query embedding.
+        :param vector_function: one of the vector functions from `pgvector.django.functions`
+        :param queryset: Optional queryset from which to retrieve documents. By default, the
+                         document_store.get_queryset() method is used.
+
+        :returns: A list of Documents for each query embedding, in the same order as
+                  `query_embeddings`, each ranked by similarity.
+        """
+        vector_function = self._get_vector_function(vector_function, query_embeddings)
+        vector_function = self._get_ranking_function(vector_function)
+
+        if not query_embeddings:
+            return []
+
+        if queryset is None:
+            queryset = self.get_queryset()
+
+        if filters:
+            queryset = queryset.apply_haystack_filters(filters)
+
+        opts = self.model._meta
+        connection = connections[queryset.db]
+        quote_name = connection.ops.quote_name
+        columns = dict.fromkeys(
+            [opts.pk.column]
+            + [opts.get_field(name).column for name in self.model._haystack.get_field_names()]
+        )
+        embedding = self._get_embedding_expression(embedding_field).resolve_expression(
+            queryset.query
+        )
+        embedding_type = embedding.output_field.db_type(connection)
+        compiler = queryset.query.get_compiler(queryset.db)
+        distance, _ = compiler.compile(
+            vector_function(
+                embedding, RawSQL("q.embedding", [], output_field=embedding.output_field)
+            )
+        )
+        score, score_params = compiler.compile(
+            _get_score_expression(
+                vector_function, RawSQL("t._distance", [], output_field=models.FloatField())
+            )
+        )
+
+        where = ""
+        params = list(score_params)
+        params.extend(
+            param
+            for index, query_embedding in enumerate(query_embeddings)
+            for param in (index, Vector._to_db(query_embedding))
+        )
+        if queryset.query.has_filters():
+            filter_sql, filter_params = queryset.values("pk").query.sql_with_params()
+            where = f"WHERE {quote_name(opts.pk.column)} IN ({filter_sql})"
+            params.extend(filter_params)
+        params.append(top_k)
+
+        sql = f"""
+            SELECT t.*, {score} AS score, q.query_index AS _query_index
+            FROM (VALUES {", ".join([f"(%s, %s::{embedding_type})"] * len(query_embeddings))})
+                AS q (query_index, embedding)
+            CROSS JOIN LATERAL (
+                SELECT {", ".join(map(quote_name, columns))}, {distance} AS _distance
+                FROM {quote_name(opts.db_table)}
+                {where}
+                ORDER BY _distance
+                LIMIT %s
+            ) AS t
+            ORDER BY q.query_index, t._distance
+        """  # noqa: S608 (only quoted identifiers and placeholders are interpolated)
+
+        results = [[] for _ in query_embeddings]
+        for obj in self.model.objects.raw(sql, params, using=queryset.db):
+            results[obj._query_index].append(obj.to_haystack_document(score=obj.score))
+
+        return results
+
     def keyword_retrieval(
         self,
         query: str,
@@ -201,6 +750,11 @@ class DjangoModelDocumentStore:
         """
         Retrieve documents from the `DjangoModelDocumentStore`, based on keywords.
 
+        Only documents matching `query` are returned. If the model maps a `search_vector` field
+        (a `SearchVectorField`, see `HaystackOptions`), it is searched instead of tokenizing the
+        content of every row at query time.
+
+        :param query: String to search in `Document`s' content.
         :param filters: Filters applied to the retrieved Documents. The way runtime filters are
                         applied depends on the `filter_policy` chosen at retriever initialization.
                         See init method docstring for more details.
@@ -214,13 +768,23 @@ class DjangoModelDocumentStore:
         if queryset is None:
             queryset = self.get_queryset()
 
-        content_field = queryset.model._haystack.get_field("content")
         top_k = top_k or self.top_k
 
+        queryset = queryset.only(
+            *queryset.model._haystack.get_field_names(exclude=self.keyword_retrieval_exclude)
+        )
+
         search_query = SearchQuery(query, config=self.language)
-        search_vector = SearchVector(content_field.name, config=self.language)
+
+        if search_vector_field := queryset.model._haystack.get_field("search_vector"):
+            # Already tokenized when the row was written, and can be served by a GIN index
+            search_vector = F(search_vector_field.name)
+        else:
+            content_field = queryset.model._haystack.get_field("content")
+            search_vector = SearchVector(content_field.name, config=self.language)
 
         queryset = queryset.annotate(score=SearchRank(search_vector, search_query))
+        queryset = queryset.filter(SearchVectorExact(search_vector, search_query))
         queryset = queryset.order_by("-score")
 
         if filters:
@@ -1,4 +1,6 @@
 import logging
+from functools import cached_property
+from io import StringIO
 from typing import Any, Dict
 
 from django.core.exceptions import FieldDoesNotExist
@@ -6,7 +8,6 @@ from django.db import models
 from django.db.models import Q
 from django.db.models.base import ModelBase
 from haystack.dataclasses.document import ByteStream, Document, SparseEmbedding
-from pandas import read_json
 
 log = logging.getLogger(__name__)
 
@@ -31,8 +32,15 @@ class HaystackOptions:
             "blob_meta": getattr(declared_options, "blob_meta_field", "blob_meta"),
             "blob_mime_type": getattr(declared_options, "blob_mime_type_field", "blob_mime_type"),
             "score": getattr(declared_options, "score_field", "score"),
+            "search_vector": getattr(declared_options, "search_vector_field", "search_vector"),
         }
         self.vector_function = getattr(declared_options, "vector_function", None)
+        # Set to "halfvec" to compare a `vector` column at half precision (see README)
+        self.embedding_type = getattr(declared_options, "embedding_type", None)
+        # A `BitField` holding the binary quantized embedding, used to preselect candidates
+        self.binary_embedding_field = getattr(declared_options, "binary_embedding_field", None)
+        # Rank `L2Distance` retrievals by the squared distance, for embeddings without an index
+        self.squared_l2_ranking = getattr(declared_options, "squared_l2_ranking", False)
 
     def __repr__(self):
         return f"<HaystackOptions for model {self.model.__name__}>"
@@ -50,14 +58,44 @@ class HaystackOptions:
         self.model = cls
         cls._haystack = self
 
+    @cached_property
+    def _fields(self) -> dict[str, models.fields.Field | None]:
+        fields = {}
+        for haystack_field_name, field_name in self.field_map.items():
+            try:
+                fields[haystack_field_name] = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                fields[haystack_field_name] = None
+        return fields
+
     def get_field(self, haystack_field_name: str) -> models.fields.Field | None:
         if haystack_field_name not in self.field_map:
             raise ValueError(f"Field {haystack_field_name} is not a valid haystack Document field")
 
-        try:
-            return self.model._meta.get_field(self.field_map[haystack_field_name])
-        except FieldDoesNotExist:
-            return None
+        return self._fields[haystack_field_name]
+
+    @cached_property
+    def document_fields(self) -> list[tuple[str, models.fields.Field]]:
+        """
+        The `(haystack field name, model field)` pairs for every mapped field defined on the
+        model. Resolved once per model, as it is used for every row converted to a Document.
+        """
+        return [
+            (name, field)
+            for name in self.field_map
+            if name != "search_vector" and (field := self.get_field(name)) is not None
+        ]
+
+    def get_field_names(self, *haystack_field_names: str, exclude=()) -> list[str]:
+        """
+        Returns the names of the model fields mapped to the given haystack fields, skipping any
+        haystack field that is not defined on the model. All mapped fields are used by default.
+        """
+        return [
+            field.name
+            for name, field in self.document_fields
+            if (not haystack_field_names or name in haystack_field_names) and name not in exclude
+        ]
 
 
 class HaystackDocumentStoreQuerySet(models.QuerySet):
@@ -74,20 +112,43 @@ class HaystackDocumentStoreQuerySet(models.QuerySet):
         return self._apply_filters(filters)
 
     def _apply_filters(self, filter_spec: Dict[str, Any]) -> models.QuerySet:
-        if "field" in filter_spec:
-            return self.filter(self._parse_comparison(filter_spec))
-        else:
-            return self.filter(self._parse_logical(filter_spec))
+        # Walk the filter tree depth-first with an explicit stack, validating each logical node
+        # once, then build the Q objects bottom-up.
+        nodes = []
+        stack = [(filter_spec, None)]
+        while stack:
+            spec, parent = stack.pop()
+            nodes.append((spec, parent))
+            if "field" not in spec:
+                self._validate_logical(spec)
+                parent = len(nodes) - 1
+                stack.extend((condition, parent) for condition in reversed(spec["conditions"]))
+
+        # Children are visited after their parent, so iterating in reverse completes each node's
+        # children before the node itself. They are collected in reverse order.
+        children = [[] for _ in nodes]
+        for index in range(len(nodes) - 1, -1, -1):
+            spec, parent = nodes[index]
+            if "field" in spec:
+                q = self._parse_comparison(spec)
+            else:
+                q = self._parse_logical(spec, children[index][::-1])
+            if parent is None:
+                return self.filter(q)
+            children[parent].append(q)
 
     def _parse_comparison(self, filter_spec: Dict[str, Any]) -> Q:
-        field = filter_spec["field"]
+        field = self._get_lookup_path(filter_spec["field"])
         operator = filter_spec["operator"]
         value = filter_spec["value"]
 
-        if operator == "==":
-            return Q(**{field: value})
-        elif operator == "!=":
-            return ~Q(**{field: value})
+        if operator in ("==", "!="):
+            if (contained := self._get_contained_json(field, value)) is not None:
+                # Rows without the key do not contain the object, so they match `!=`
+                q = Q(**{f"{field.split('__')[0]}__contains": contained})
+            else:
+                q = Q(**{field: value})
+            return q if operator == "==" else ~q
         elif operator == ">":
             return Q(**{f"{field}__gt": value})
         elif operator == ">=":
@@ -103,7 +164,45 @@ class HaystackDocumentStoreQuerySet(models.QuerySet):
         else:
             raise ValueError(f"Unsupported comparison operator: {operator}")
 
-    def _parse_logical(self, filter_spec: Dict[str, Any]) -> Q:
+    def _get_lookup_path(self, field: str) -> str:
+        """
+        Converts a field in Haystack's dotted syntax, e.g. `meta.key1`, into a Django lookup path
+        on the mapped model field, e.g. `meta__key1`. Lookup paths are returned unchanged.
+        """
+        if "." not in field:
+            return field
+        name, *keys = field.split(".")
+        return "__".join([self.model._haystack.field_map.get(name, name), *keys])
+
+    def _get_contained_json(self, field: str, value: Any) -> dict | None:
+        """
+        For an equality filter on a key of a JSONField, e.g. `meta__key1 == "value1"`, returns the
+        JSON object the field must contain, e.g. `{"key1": "value1"}`. Containment (`@>`) can use
+        a GIN index on the field, which the key lookup cannot. Returns None when containment would
+        not be equivalent to the lookup.
+        """
+        name, *keys = field.split("__")
+        if not keys or not isinstance(value, (str, int, float, bool)):
+            # Containment of arrays and objects also matches supersets of them
+            return None
+
+        try:
+            model_field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+        if (
+            not isinstance(model_field, models.JSONField)
+            or keys[-1] in model_field.get_lookups()
+            or any(key.isdigit() for key in keys)  # array indexes
+        ):
+            return None
+
+        for key in reversed(keys):
+            value = {key: value}
+        return value
+
+    def _validate_logical(self, filter_spec: Dict[str, Any]) -> None:
         operator = filter_spec["operator"].upper()
         conditions = filter_spec["conditions"]
 
@@ -112,36 +211,21 @@ class HaystackDocumentStoreQuerySet(models.QuerySet):
         ):
             raise ValueError("'conditions' must be a list of filter dictionaries")
 
-        if operator == "AND":
-            q_objects = Q()
-            for condition in conditions:
-                q_objects &= (
-                    self._parse_comparison(condition)
-                    if "field" in condition
-                    else self._parse_logical(condition)
-                )
-            return q_objects
-        elif operator == "OR":
-            q_objects = Q()
-            for condition in conditions:
-                q_objects |= (
-                    self._parse_comparison(condition)
-                    if "field" in condition
-                    else self._parse_logical(condition)
-                )
-            return q_objects
-        elif operator == "NOT":
-            if len(conditions) != 1:
-                raise ValueError("NOT operator must have exactly one condition")
-            condition = conditions[0]
-            return (
-                ~self._parse_comparison(condition)
-                if "field" in condition
-                else ~self._parse_logical(condition)
-            )
-        else:
+        if operator == "NOT" and len(conditions) != 1:
+            raise ValueError("NOT operator must have exactly one condition")
+        elif operator not in ("AND", "OR", "NOT"):
             raise ValueError(f"Unsupported logical operator: {operator}")
 
+    def _parse_logical(self, filter_spec: Dict[str, Any], children: list[Q]) -> Q:
+        """
+        Combines the already parsed `conditions` of a validated logical filter.
+        """
+        operator = filter_spec["operator"].upper()
+
+        if operator == "NOT":
+            return ~children[0]
+        return Q(*children, _connector=getattr(Q, operator))
+
 
 class HaystackDocumentMetaclass(ModelBase):
     """
@@ -170,41 +254,59 @@ class HaystackDocumentStoreModel(models.Model, metaclass=HaystackDocumentMetacla
     class Meta:
         abstract = True
 
-    def _get_haystack_field_value(self, haystack_field_name):
-        field = self._haystack.get_field(haystack_field_name)
-        return getattr(self, field.name, None) if field else None
-
     def to_haystack_document(self, **kwargs) -> Document:
         """
         Convert model instance to a Haystack Document.
+
+        Deferred fields (see `QuerySet.defer()` and `QuerySet.only()`) are left out of the
+        Document rather than being loaded with an extra query.
+        """
+        # Deferred fields are the ones missing from the instance __dict__
+        values = {
+            name: getattr(self, field.name)
+            for name, field in self._haystack.document_fields
+            if field.attname in self.__dict__
+        }
+        return self.values_to_haystack_document(values, **kwargs)
+
+    @classmethod
+    def values_to_haystack_document(cls, values: dict[str, Any], **kwargs) -> Document:
+        """
+        Convert field values keyed by haystack field name to a Haystack Document.
+
+        This allows building Documents from `QuerySet.values()` rows without instantiating the
+        model.
         """
         # Construct a JSON object that can be passed to Document.from_dict()
         blob = None
-        if blob_data := self._get_haystack_field_value("blob_data"):
+        if blob_data := values.get("blob_data"):
             blob = ByteStream(
                 data=blob_data,
-                meta=self._get_haystack_field_value("blob_meta"),
-                mime_type=self._get_haystack_field_value("blob_mime_type"),
+                meta=values.get("blob_meta"),
+                mime_type=values.get("blob_mime_type"),
             )
 
-        if dataframe := self._get_haystack_field_value("dataframe"):
-            dataframe = read_json(dataframe)
+        if dataframe := values.get("dataframe"):
+            # pandas is costly to import and only needed for documents holding a dataframe
+            from pandas import read_json
+
+            dataframe = read_json(StringIO(dataframe))
 
-        if sparse_embedding := self._get_haystack_field_value("sparse_embedding"):
+        if sparse_embedding := values.get("sparse_embedding"):
             sparse_embedding = SparseEmbedding(
                 indices=sparse_embedding.indices,
                 values=sparse_embedding.values,
             )
 
         attrs = dict(
-            id=self._get_haystack_field_value("id"),
-            content=self._get_haystack_field_value("content"),
+            id=values.get("id"),
+            content=values.get("content"),
             dataframe=dataframe,
             blob=blob,
-            meta=self._get_haystack_field_value("meta"),
-            score=self._get_haystack_field_value("score"),
-            embedding=self._get_haystack_field_value("embedding"),
-            sparse_embedding=self._get_haystack_field_value("sparse_embedding"),
+            meta=values.get("meta"),
+            score=values.get("score"),
+            embedding=values.get("embedding"),
+            sparse_embedding=values.get("sparse_embedding"),
         )
         attrs.update(kwargs)
 
@@ -9,6 +9,9 @@ from pgvector.django.functions import BitDistanceBase, DistanceBase
 
 from django_haystack.document_store import DjangoModelDocumentStore
 
+# Postgres default for `hnsw.ef_search`
+DEFAULT_HNSW_EF_SEARCH = 40
+
 
 @component
 class DjangoModelEmbeddingRetriever:
@@ -26,6 +29,9 @@ class DjangoModelEmbeddingRetriever:
         top_k: int = 10,
         filter_policy: str | FilterPolicy = FilterPolicy.REPLACE,
         vector_function: type[DistanceBase | BitDistanceBase] = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        max_distance: float | None = None,
     ):
         """
         :param document_store: An instance of `PgvectorDocumentStore`.
@@ -36,11 +42,21 @@ class DjangoModelEmbeddingRetriever:
             **Important**: if the underlying document model is using the `"hnsw"` search index, the
             vector function should match the opclass utilized in the index.
         :param filter_policy: Policy to determine how filters are applied.
+        :param ef_search: The `hnsw.ef_search` setting used when searching an HNSW index. An HNSW
+            index scan returns at most `ef_search` documents, so when not set, `top_k` is used
+            if it is greater than the Postgres default of 40.
+        :param probes: The `ivfflat.probes` setting used when searching an IVFFlat index. Higher
+            values improve recall at the cost of speed. Defaults to the Postgres setting.
+        :param max_distance: Only retrieve documents within this distance of the query embedding,
+            as measured by the vector function.
         """
         self.document_store = document_store
         self.vector_function = vector_function
         self.filters = filters or {}
         self.top_k = top_k
+        self.ef_search = ef_search
+        self.probes = probes
+        self.max_distance = max_distance
 
         if isinstance(filter_policy, FilterPolicy):
             self.filter_policy = filter_policy
@@ -55,6 +71,9 @@ class DjangoModelEmbeddingRetriever:
             top_k=self.top_k,
             filter_policy=self.filter_policy.value,
             vector_function=self.vector_function.__name__,
+            ef_search=self.ef_search,
+            probes=self.probes,
+            max_distance=self.max_distance,
         )
 
     @classmethod
@@ -79,6 +98,7 @@ class DjangoModelEmbeddingRetriever:
         filters: dict[str, Any] = None,
         top_k: int = None,
         vector_function: type[DistanceBase | BitDistanceBase] = None,
+        max_distance: float | None = None,
     ):
         """
         Retrive documents from the `DjangoModelDocumentStore`, based on their dense embeddings.
@@ -91,6 +111,7 @@ class DjangoModelEmbeddingRetriever:
         :param queryset: Optional queryset from which to retrieve documents. By default, the
                          document_store.get_queryset() method is used.
         :param vector_function: one of the vector functions from `pgvector.django.functions`
+        :param max_distance: Only retrieve documents within this distance of the query embedding.
 
         :returns: A dictionary with the following keys:
             - `documents`: List of `Document`s that match the query.
@@ -98,15 +119,29 @@ class DjangoModelEmbeddingRetriever:
         filters = apply_filter_policy(self.filter_policy, self.filters, filters)
         top_k = top_k or self.top_k
         vector_function = vector_function or self.vector_function
+        if max_distance is None:
+            max_distance = self.max_distance
 
         queryset = self.document_store.embedding_retrieval(
             query_embedding,
             filters=filters,
             top_k=top_k,
             vector_function=vector_function,
+            max_distance=max_distance,
         )
+        field_names = self.document_store.model._haystack.get_field_names()
+        ef_search = self.ef_search
+        if ef_search is None and top_k > DEFAULT_HNSW_EF_SEARCH:
+            ef_search = top_k
+
+        with self.document_store.search_parameters(
+            ef_search=ef_search, probes=self.probes, using=queryset.db
+        ):
+            documents = self.document_store._rows_to_documents(
+                queryset.values(*field_names, "score")
+            )
 
-        return {"documents": [obj.to_haystack_document(score=obj.score) for obj in queryset]}
+        return {"documents": documents}
 
 
 @component
@@ -209,5 +244,12 @@ class DjangoModelKeywordRetriever:
             filters=filters,
             top_k=top_k or self.top_k,
         )
+        field_names = self.document_store.model._haystack.get_field_names(
+            exclude=self.document_store.keyword_retrieval_exclude
+        )
 
-        return {"documents": [obj.to_haystack_document(score=obj.score) for obj in queryset]}
+        return {
+            "documents": self.document_store._rows_to_documents(
+                queryset.values(*field_names, "score")
+            )
+        }
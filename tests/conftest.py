@@ -1,14 +1,110 @@
+from contextlib import contextmanager
+
 import pytest
 from django.apps import apps
 from django.db import connection
 from django.db.models.signals import pre_migrate
+from django.test.utils import CaptureQueriesContext
+from haystack.dataclasses import Document
+from testapp.models import AutoPkDocument, BasicDocument, FullDocument
+
+from django_haystack.document_store import DjangoModelDocumentStore
 
 
-def _pre_migration(sender, app_config, **kwargs):
+def _create_vector_extension(sender, app_config, **kwargs):
     with connection.cursor() as cursor:
-        cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'vector'")
+        if cursor.fetchone() is None:
+            cursor.execute("CREATE EXTENSION vector")
 
 
 @pytest.fixture(autouse=True, scope="session")
 def django_test_environment(django_test_environment):
-    pre_migrate.connect(_pre_migration, sender=apps.get_app_config("testapp"))
+    # The test database is created by pytest-django's `django_db_setup`, and migrate creates the
+    # test tables right after, so the pgvector extension is created from the one pre_migrate
+    # signal sent for the testapp.
+    pre_migrate.connect(
+        _create_vector_extension,
+        sender=apps.get_app_config("testapp"),
+        dispatch_uid="tests.create_vector_extension",
+    )
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Returns a context manager asserting that at most `n` queries are run in its block, not
+    counting the savepoints Django wraps around writes.
+    """
+
+    @contextmanager
+    def assert_max_queries(n):
+        with CaptureQueriesContext(connection) as captured:
+            yield captured
+        queries = [
+            query["sql"]
+            for query in captured
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+        ]
+        assert len(queries) <= n, f"{len(queries)} queries run, expected at most {n}: {queries}"
+
+    return assert_max_queries
+
+
+@pytest.fixture
+def pgvector_version():
+    """
+    Returns the version of the pgvector extension installed in the test database.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        return tuple(int(part) for part in cursor.fetchone()[0].split("."))
+
+
+@pytest.fixture(scope="session")
+def document_store():
+    return DjangoModelDocumentStore.get_or_create(BasicDocument)
+
+
+@pytest.fixture(scope="session")
+def full_document_store():
+    return DjangoModelDocumentStore.get_or_create(FullDocument)
+
+
+@pytest.fixture(scope="session")
+def auto_pk_document_store():
+    return DjangoModelDocumentStore.get_or_create(AutoPkDocument)
+
+
+@pytest.fixture(scope="session")
+def sample_documents():
+    return (
+        Document(
+            id="doc1",
+            content="test content 1",
+            meta={"key1": "value1"},
+        ),
+        Document(
+            id="doc2",
+            content="test content 2",
+            meta={"key2": "value2"},
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_documents_with_embeddings():
+    return (
+        Document(
+            id="doc1",
+            content="test content 1",
+            meta={"key1": "value1"},
+            embedding=[1.0, 0.0, 0.0],
+        ),
+        Document(
+            id="doc2",
+            content="test content 2",
+            meta={"key2": "value2"},
+            embedding=[0.0, 1.0, 0.0],
+        ),
+    )
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -37,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django_haystack",
     "testapp",
 ]
 
@@ -74,14 +76,25 @@ WSGI_APPLICATION = "test_project.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Connect to the host in POSTGRES_HOST (set by docker compose and CI) or PGHOST when set,
+# otherwise through the local Unix socket when a server is listening on it, and over TCP to the
+# `db` service otherwise
+POSTGRES_SOCKET_DIR = Path("/var/run/postgresql")
+POSTGRES_HOST = (
+    os.environ.get("POSTGRES_HOST")
+    or os.environ.get("PGHOST")
+    or (str(POSTGRES_SOCKET_DIR) if (POSTGRES_SOCKET_DIR / ".s.PGSQL.5432").exists() else "db")
+)
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": "test_pgvector_haystack",
         "USER": "postgres",
         "PASSWORD": "postgres",
-        "HOST": "db",
-        "PORT": "5432",
+        "HOST": POSTGRES_HOST,
+        "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        "OPTIONS": {"options": "-c work_mem=64MB -c maintenance_work_mem=256MB"},
     }
 }
 
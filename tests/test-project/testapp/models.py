@@ -1,6 +1,8 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django_haystack.models import HaystackDocumentStoreModel
-from pgvector.django import VectorField
+from pgvector.django import BitField, VectorField
 from pgvector.django.functions import CosineDistance
 
 class BasicDocument(HaystackDocumentStoreModel):
@@ -8,15 +10,38 @@ class BasicDocument(HaystackDocumentStoreModel):
     content = models.TextField(blank=True)
     meta = models.JSONField(default=dict)
 
+    class Meta:
+        indexes = [GinIndex(name="basic_meta_gin", fields=["meta"], opclasses=["jsonb_path_ops"])]
+
 class FullDocument(HaystackDocumentStoreModel):
     id = models.CharField(max_length=100, primary_key=True) 
     content = models.TextField(blank=True)
     embedding = VectorField(dimensions=3)
+    binary_embedding = BitField(length=3, null=True)
     meta = models.JSONField(default=dict)
     dataframe = models.JSONField(null=True)
     blob_data = models.BinaryField(null=True)
     blob_meta = models.JSONField(null=True)
     blob_mime_type = models.CharField(max_length=100, null=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("content", config="english"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(name="full_meta_gin", fields=["meta"], opclasses=["jsonb_path_ops"]),
+            GinIndex(name="full_search_vector_gin", fields=["search_vector"]),
+        ]
     
     class HaystackOptions:
         vector_function = CosineDistance
+
+class AutoPkDocument(HaystackDocumentStoreModel):
+    document_id = models.CharField(max_length=100, unique=True)
+    content = models.TextField(blank=True)
+    meta = models.JSONField(default=dict)
+
+    class HaystackOptions:
+        id_field = "document_id"
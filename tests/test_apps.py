@@ -0,0 +1,68 @@
+import pytest
+from django.apps import apps
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+from pgvector import Vector
+
+from django_haystack.apps import register_vector_types, register_vector_types_after_migrate
+
+
+@pytest.fixture
+def other_connection():
+    """
+    Returns a new connection to the test database, so that registering types on it does not
+    affect the connection shared by the other tests.
+    """
+    other_connection = type(connections["default"])(connection.settings_dict, alias="other")
+    other_connection.ensure_connection()
+    yield other_connection
+    other_connection.close()
+
+
+def test_register_vector_types_setting(settings):
+    app_config = apps.get_app_config("django_haystack")
+    dispatch_uid = "django_haystack.register_vector_types"
+    assert not connection_created.disconnect(dispatch_uid=dispatch_uid)
+
+    settings.DJANGO_HAYSTACK_REGISTER_VECTOR_TYPES = True
+    app_config.ready()
+
+    assert connection_created.disconnect(dispatch_uid=dispatch_uid)
+    assert post_migrate.disconnect(
+        sender=app_config, dispatch_uid="django_haystack.register_vector_types_after_migrate"
+    )
+
+
+@pytest.mark.django_db
+def test_vector_types_not_registered_by_default():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT '[1,2,3]'::vector")
+        value = cursor.fetchone()[0]
+
+    assert value == "[1,2,3]"
+
+
+@pytest.mark.django_db
+def test_register_vector_types(other_connection):
+    register_vector_types(sender=None, connection=other_connection)
+
+    with other_connection.cursor() as cursor:
+        cursor.execute("SELECT '[1,2,3]'::vector")
+        value = cursor.fetchone()[0]
+
+    assert isinstance(value, Vector)
+    assert value.to_list() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.django_db
+def test_register_vector_types_after_migrate(other_connection, monkeypatch):
+    monkeypatch.setattr("django_haystack.apps.connections", {"other": other_connection})
+
+    register_vector_types_after_migrate(sender=None, using="other")
+
+    with other_connection.cursor() as cursor:
+        cursor.execute("SELECT '[1,2,3]'::vector")
+        value = cursor.fetchone()[0]
+
+    assert isinstance(value, Vector)
@@ -1,63 +1,20 @@
 import pytest
-from django.db import connection
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
 from haystack.dataclasses import Document
 from haystack.document_stores.errors import DuplicateDocumentError
-from haystack.document_stores.errors import DuplicateDocumentError
 from haystack.document_stores.types import DuplicatePolicy
 from pgvector.django import CosineDistance, L1Distance, L2Distance, MaxInnerProduct
-from testapp.models import BasicDocument, FullDocument
+from testapp.models import AutoPkDocument, BasicDocument, FullDocument
 
 from django_haystack.document_store import DjangoModelDocumentStore
 
 
-@pytest.fixture
-def document_store():
-    return DjangoModelDocumentStore(model=BasicDocument)
-
-
-@pytest.fixture
-def full_document_store():
-    return DjangoModelDocumentStore(model=FullDocument)
-
-
-@pytest.fixture
-def sample_documents():
-    return [
-        Document(
-            id="doc1",
-            content="test content 1",
-            meta={"key1": "value1"},
-        ),
-        Document(
-            id="doc2",
-            content="test content 2",
-            meta={"key2": "value2"},
-        ),
-    ]
-
-
-@pytest.fixture
-def sample_documents_with_embeddings():
-    return [
-        Document(
-            id="doc1",
-            content="test content 1",
-            meta={"key1": "value1"},
-            embedding=[1.0, 0.0, 0.0],
-        ),
-        Document(
-            id="doc2",
-            content="test content 2",
-            meta={"key2": "value2"},
-            embedding=[0.0, 1.0, 0.0],
-        ),
-    ]
-
-
 @pytest.mark.django_db
 class TestDjangoModelDocumentStore:
     def test_init(self, document_store):
         assert document_store.model._meta.model_name == BasicDocument._meta.model_name
+        assert document_store.model == BasicDocument
         assert document_store.language == "english"
 
     def test_init_default_language(self):
@@ -71,6 +28,7 @@ class TestDjangoModelDocumentStore:
                 document_store.model._meta.model_name,
             ),
             "language": document_store.language,
+            "assume_normalized": False,
         }
         assert document_store.to_dict() == expected_dict
 
@@ -87,6 +45,17 @@ class TestDjangoModelDocumentStore:
         assert new_document_store.model == document_store.model
         assert new_document_store.language == "spanish"
 
+    def test_get_or_create(self):
+        document_store = DjangoModelDocumentStore.get_or_create(BasicDocument)
+
+        assert DjangoModelDocumentStore.get_or_create(BasicDocument) is document_store
+        assert DjangoModelDocumentStore.from_dict(document_store.to_dict()) is document_store
+        assert DjangoModelDocumentStore.get_or_create(FullDocument) is not document_store
+        assert (
+            DjangoModelDocumentStore.get_or_create(BasicDocument, language="spanish")
+            is not document_store
+        )
+
     def test_haystack_options(self, document_store):
         assert hasattr(document_store.model, "_haystack")
         assert document_store.model._haystack.model == document_store.model
@@ -98,11 +67,13 @@ class TestDjangoModelDocumentStore:
         document_store.write_documents(sample_documents)
         assert document_store.count_documents() == 2
 
-    def test_write_documents(self, document_store, sample_documents):
-        num_written = document_store.write_documents(sample_documents)
+    def test_write_documents(self, document_store, sample_documents, max_queries):
+        with max_queries(2):
+            num_written = document_store.write_documents(sample_documents)
         assert num_written == 2
         
-        docs = document_store.filter_documents()
+        with max_queries(1):
+            docs = document_store.filter_documents()
         assert len(docs) == 2
         assert {d.id for d in docs} == {"doc1", "doc2"}
 
@@ -125,7 +96,19 @@ class TestDjangoModelDocumentStore:
         assert num_written == 0
         assert document_store.count_documents() == 2
 
-    def test_write_documents_duplicate_overwrite(self, document_store, sample_documents):
+    def test_write_documents_duplicate_skip_partial(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents[:1])
+
+        num_written = document_store.write_documents(
+            sample_documents,
+            policy=DuplicatePolicy.SKIP
+        )
+        assert num_written == 1
+        assert document_store.count_documents() == 2
+
+    def test_write_documents_duplicate_overwrite(
+        self, document_store, sample_documents, max_queries
+    ):
         document_store.write_documents(sample_documents)
         
         modified_docs = [
@@ -136,12 +119,120 @@ class TestDjangoModelDocumentStore:
             )
         ]
         
-        num_written = document_store.write_documents(
-            modified_docs,
-            policy=DuplicatePolicy.OVERWRITE
-        )
+        with max_queries(1):
+            num_written = document_store.write_documents(
+                modified_docs,
+                policy=DuplicatePolicy.OVERWRITE
+            )
         assert num_written == 1
         
+        with max_queries(1):
+            docs = document_store.filter_documents()
+        modified_doc = next(d for d in docs if d.id == "doc1")
+        assert modified_doc.content == "modified content"
+        assert modified_doc.meta == {"key": "modified"}
+
+    @pytest.mark.parametrize(
+        "policy", [DuplicatePolicy.NONE, DuplicatePolicy.SKIP, DuplicatePolicy.OVERWRITE]
+    )
+    def test_write_documents_single_insert(self, document_store, policy):
+        documents = [Document(id=f"doc{i}", content=f"test content {i}") for i in range(5)]
+
+        with CaptureQueriesContext(connection) as captured:
+            num_written = document_store.write_documents(documents, policy=policy)
+
+        assert num_written == 5
+        inserts = [query for query in captured if query["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+
+    @pytest.mark.parametrize(
+        "policy", [DuplicatePolicy.NONE, DuplicatePolicy.SKIP, DuplicatePolicy.OVERWRITE]
+    )
+    def test_write_documents_bulk_copy(
+        self, full_document_store, sample_documents_with_embeddings, policy
+    ):
+        num_written = full_document_store.write_documents_bulk_copy(
+            sample_documents_with_embeddings, policy=policy
+        )
+        assert num_written == 2
+
+        docs = sorted(full_document_store.filter_documents(), key=lambda d: d.id)
+        assert docs == list(sample_documents_with_embeddings)
+
+    @pytest.mark.parametrize(
+        "policy", [DuplicatePolicy.NONE, DuplicatePolicy.SKIP, DuplicatePolicy.OVERWRITE]
+    )
+    def test_write_documents_bulk_copy_auto_pk(
+        self, auto_pk_document_store, sample_documents, policy
+    ):
+        auto_pk_document_store.write_documents(sample_documents[:1])
+
+        num_written = auto_pk_document_store.write_documents_bulk_copy(
+            sample_documents[1:], policy=policy
+        )
+
+        assert num_written == 1
+        docs = sorted(auto_pk_document_store.filter_documents(), key=lambda d: d.id)
+        assert docs == list(sample_documents)
+        assert AutoPkDocument.objects.filter(pk=None).count() == 0
+
+    def test_write_documents_bulk_copy_auto_pk_overwrite(
+        self, auto_pk_document_store, sample_documents
+    ):
+        auto_pk_document_store.write_documents(sample_documents)
+        pk = AutoPkDocument.objects.get(document_id="doc1").pk
+
+        num_written = auto_pk_document_store.write_documents_bulk_copy(
+            [Document(id="doc1", content="modified content")], policy=DuplicatePolicy.OVERWRITE
+        )
+
+        assert num_written == 1
+        modified_doc = AutoPkDocument.objects.get(document_id="doc1")
+        assert modified_doc.pk == pk
+        assert modified_doc.content == "modified content"
+
+    @pytest.mark.parametrize("store_fixture", ["document_store", "auto_pk_document_store"])
+    def test_write_documents_overwrite_copy_threshold(
+        self, store_fixture, sample_documents, monkeypatch, request
+    ):
+        document_store = request.getfixturevalue(store_fixture)
+        monkeypatch.setattr("django_haystack.document_store.COPY_THRESHOLD", 1)
+        document_store.write_documents(sample_documents[:1])
+
+        with CaptureQueriesContext(connection) as captured:
+            num_written = document_store.write_documents(
+                sample_documents, policy=DuplicatePolicy.OVERWRITE
+            )
+
+        assert num_written == 2
+        assert document_store.count_documents() == 2
+        assert any(query["sql"].startswith("CREATE TEMPORARY TABLE") for query in captured)
+
+    def test_write_documents_bulk_copy_duplicate_fail(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents)
+
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents_bulk_copy(sample_documents, policy=DuplicatePolicy.FAIL)
+        assert document_store.count_documents() == 2
+
+    def test_write_documents_bulk_copy_duplicate_skip(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents[:1])
+
+        num_written = document_store.write_documents_bulk_copy(
+            sample_documents, policy=DuplicatePolicy.SKIP
+        )
+        assert num_written == 1
+        assert document_store.count_documents() == 2
+
+    def test_write_documents_bulk_copy_duplicate_overwrite(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents)
+
+        modified_docs = [Document(id="doc1", content="modified content", meta={"key": "modified"})]
+        num_written = document_store.write_documents_bulk_copy(
+            modified_docs, policy=DuplicatePolicy.OVERWRITE
+        )
+        assert num_written == 1
+
         docs = document_store.filter_documents()
         modified_doc = next(d for d in docs if d.id == "doc1")
         assert modified_doc.content == "modified content"
@@ -157,14 +248,15 @@ class TestDjangoModelDocumentStore:
         docs = document_store.filter_documents()
         assert docs[0].id == "doc2"
 
-    def test_filter_documents(self, document_store, sample_documents):
+    @pytest.mark.parametrize("field", ["meta__key1", "meta.key1"])
+    def test_filter_documents(self, document_store, sample_documents, field):
         document_store.write_documents(sample_documents)
         
         filters = {
             "operator": "AND",
             "conditions": [
                 {
-                    "field": "meta__key1",
+                    "field": field,
                     "operator": "==",
                     "value": "value1"
                 }
@@ -174,6 +266,78 @@ class TestDjangoModelDocumentStore:
         assert len(docs) == 1
         assert docs[0].id == "doc1"
 
+    def test_filter_documents_nested_logical(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents)
+
+        filters = {
+            "operator": "OR",
+            "conditions": [
+                {"field": "meta__key1", "operator": "==", "value": "value1"},
+                {
+                    "operator": "AND",
+                    "conditions": [
+                        {"field": "content", "operator": "!=", "value": "test content 1"},
+                        {"field": "meta__key2", "operator": "in", "value": ["value2"]},
+                    ],
+                },
+            ],
+        }
+        docs = document_store.filter_documents(filters)
+        assert {d.id for d in docs} == {"doc1", "doc2"}
+
+        filters = {
+            "operator": "NOT",
+            "conditions": [{"field": "content", "operator": "==", "value": "test content 1"}],
+        }
+        docs = document_store.filter_documents(filters)
+        assert [d.id for d in docs] == ["doc2"]
+
+    def test_filter_documents_meta_containment(self, document_store):
+        document_store.write_documents(
+            [
+                Document(id="doc1", content="a", meta={"key1": "value1", "nested": {"n": 1}}),
+                Document(id="doc2", content="b", meta={"key1": ["value1", "value2"]}),
+            ]
+        )
+
+        queryset = document_store.get_queryset().apply_haystack_filters(
+            {"field": "meta.nested.n", "operator": "==", "value": 1}
+        )
+        assert '"testapp_basicdocument"."meta" @>' in str(queryset.query)
+        assert [obj.id for obj in queryset] == ["doc1"]
+
+        filters = {"field": "meta__key1", "operator": "==", "value": "value1"}
+        assert document_store.filter_document_ids(filters) == ["doc1"]
+
+        # Containment would also match supersets of a list, so lists use the key lookup
+        filters = {"field": "meta__key1", "operator": "==", "value": ["value1"]}
+        assert document_store.filter_document_ids(filters) == []
+
+    def test_filter_documents_meta_missing_key(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents)
+        condition = {"field": "meta.key1", "operator": "==", "value": "value1"}
+
+        # doc2 has no key1, so it matches both the negated equality and the inequality
+        filters = {"operator": "NOT", "conditions": [condition]}
+        assert document_store.filter_document_ids(filters) == ["doc2"]
+
+        filters = {**condition, "operator": "!="}
+        assert document_store.filter_document_ids(filters) == ["doc2"]
+
+    def test_count_filtered(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents)
+
+        filters = {"field": "meta__key1", "operator": "==", "value": "value1"}
+        assert document_store.count_filtered() == 2
+        assert document_store.count_filtered(filters) == 1
+
+    def test_filter_document_ids(self, document_store, sample_documents):
+        document_store.write_documents(sample_documents)
+
+        filters = {"field": "meta__key2", "operator": "==", "value": "value2"}
+        assert sorted(document_store.filter_document_ids()) == ["doc1", "doc2"]
+        assert document_store.filter_document_ids(filters) == ["doc2"]
+
     @pytest.mark.django_db(transaction=True)
     def test_embedding_retrieval_no_vector_function(self, document_store, sample_documents_with_embeddings):
         document_store.write_documents(sample_documents_with_embeddings)
@@ -200,10 +364,175 @@ class TestDjangoModelDocumentStore:
 
         assert len(results) == 2
         # Assert that doc1 has a higher score than doc2 because the query is more similar to doc1
-        assert results[0].id == "doc2"
+        assert results[0].id == "doc1"
         assert results[1].id == "doc2"
         assert results[0].score > results[1].score
 
+    def test_embedding_retrieval_assume_normalized(self, sample_documents_with_embeddings):
+        document_store = DjangoModelDocumentStore(model=FullDocument, assume_normalized=True)
+        document_store.write_documents(sample_documents_with_embeddings)
+        query_embedding = [0.6, 0.8, 0.0]
+
+        results = document_store.embedding_retrieval(
+            query_embedding=query_embedding, top_k=2, vector_function=CosineDistance
+        )
+        expected = DjangoModelDocumentStore(model=FullDocument).embedding_retrieval(
+            query_embedding=query_embedding, top_k=2, vector_function=CosineDistance
+        )
+
+        assert "<#>" in str(results.query)
+        assert [d.id for d in results] == [d.id for d in expected] == ["doc2", "doc1"]
+        assert [d.score for d in results] == pytest.approx([d.score for d in expected])
+
+    def test_embedding_retrieval_assume_normalized_warns(self, settings, caplog):
+        settings.DEBUG = True
+        document_store = DjangoModelDocumentStore(model=FullDocument, assume_normalized=True)
+
+        document_store.embedding_retrieval_batch(
+            [[0.6, 0.8, 0.0], [2.0, 0.0, 0.0]], vector_function=CosineDistance
+        )
+
+        assert [record.getMessage() for record in caplog.records] == [
+            "Query embedding has norm 2.0, but the document store assumes normalized embeddings"
+        ]
+
+    @pytest.mark.parametrize("assume_normalized", [False, True])
+    def test_embedding_retrieval_max_distance(
+        self, sample_documents_with_embeddings, assume_normalized
+    ):
+        document_store = DjangoModelDocumentStore(
+            model=FullDocument, assume_normalized=assume_normalized
+        )
+        document_store.write_documents(sample_documents_with_embeddings)
+
+        results = document_store.embedding_retrieval(
+            query_embedding=[0.6, 0.8, 0.0],
+            top_k=2,
+            vector_function=CosineDistance,
+            max_distance=0.3,
+        )
+
+        assert "WHERE" in str(results.query)
+        assert [d.id for d in results] == ["doc2"]
+
+    def test_embedding_retrieval_prefilter(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[0.9, 0.1, 0.0],
+            filters={"field": "meta__key2", "operator": "==", "value": "value2"},
+            top_k=2,
+            prefilter=True,
+        )
+
+        assert [r.id for r in results] == ["doc2"]
+
+    def test_embedding_retrieval_prefilter_many_matches(
+        self, full_document_store, sample_documents_with_embeddings, monkeypatch
+    ):
+        monkeypatch.setattr("django_haystack.document_store.PREFILTER_MAX_IDS", 1)
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[0.9, 0.1, 0.0],
+            filters={"field": "content", "operator": "!=", "value": "other"},
+            top_k=2,
+            prefilter=True,
+        )
+
+        # More documents match than PREFILTER_MAX_IDS, so they are selected with a subquery
+        assert '"id" IN (SELECT' in str(results.query)
+        assert [r.id for r in results] == ["doc1", "doc2"]
+
+    def test_search_parameters_in_transaction(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL hnsw.ef_search = 60")
+
+            with full_document_store.search_parameters(ef_search=200, probes=5):
+                cursor.execute("SHOW hnsw.ef_search")
+                assert cursor.fetchone()[0] == "200"
+
+            # Leaving the context only releases a savepoint, so the values are restored
+            cursor.execute("SHOW hnsw.ef_search")
+            assert cursor.fetchone()[0] == "60"
+            cursor.execute("SHOW ivfflat.probes")
+            assert cursor.fetchone()[0] == "1"
+
+    def test_embedding_retrieval_halfvec(
+        self, full_document_store, sample_documents_with_embeddings, monkeypatch, pgvector_version
+    ):
+        if pgvector_version < (0, 7):
+            pytest.skip("The halfvec type requires pgvector 0.7.0")
+
+        monkeypatch.setattr(FullDocument._haystack, "embedding_type", "halfvec")
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[0.9, 0.1, 0.0],
+            top_k=2,
+            vector_function=L2Distance,
+        )
+
+        assert '("testapp_fulldocument"."embedding")::halfvec(3) <->' in str(results.query)
+        assert [d.id for d in results] == ["doc1", "doc2"]
+        assert [d.score for d in results] == pytest.approx([0.1414, 1.2728], abs=1e-3)
+
+        batch_results = full_document_store.embedding_retrieval_batch(
+            [[0.9, 0.1, 0.0], [0.1, 0.9, 0.0]], top_k=2, vector_function=L2Distance
+        )
+
+        assert [[d.id for d in results] for results in batch_results] == [
+            ["doc1", "doc2"],
+            ["doc2", "doc1"],
+        ]
+        assert [d.score for d in batch_results[0]] == pytest.approx([0.1414, 1.2728], abs=1e-3)
+
+    def test_embedding_retrieval_binary_rerank(
+        self, full_document_store, monkeypatch, pgvector_version
+    ):
+        if pgvector_version < (0, 7):
+            pytest.skip("The bit distance operators require pgvector 0.7.0")
+
+        monkeypatch.setattr(FullDocument._haystack, "binary_embedding_field", "binary_embedding")
+        monkeypatch.setattr("django_haystack.document_store.BINARY_RERANK_FACTOR", 1)
+        full_document_store.write_documents(
+            [
+                Document(id="doc1", content="", embedding=[1.0, 0.0, 0.0]),
+                Document(id="doc2", content="", embedding=[0.9, 0.1, 0.01]),
+                Document(id="doc3", content="", embedding=[0.9, 0.1, 0.0]),
+            ]
+        )
+        for doc_id, bits in (("doc1", "110"), ("doc2", "001"), ("doc3", "100")):
+            FullDocument.objects.filter(id=doc_id).update(binary_embedding=bits)
+
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[0.9, 0.1, 0.0],
+            top_k=2,
+            vector_function=L2Distance,
+        )
+
+        sql = str(results.query)
+        assert '"binary_embedding" <~> 110' in sql
+        # doc2 is close, but not among the 2 candidates preselected by hamming distance (doc1,
+        # doc3), which are then reranked by their full embeddings
+        assert [d.id for d in results] == ["doc3", "doc1"]
+
+    def test_embedding_retrieval_binary_rerank_length_mismatch(
+        self, full_document_store, monkeypatch
+    ):
+        monkeypatch.setattr(FullDocument._haystack, "binary_embedding_field", "binary_embedding")
+
+        with pytest.raises(ValueError, match="4 dimensions, but 'binary_embedding' holds 3 bits"):
+            full_document_store.embedding_retrieval(
+                query_embedding=[0.9, 0.1, 0.0, 0.0], top_k=2, vector_function=L2Distance
+            )
+
     @pytest.mark.django_db(transaction=True)
     def test_embedding_retrieval_l2_distance(self, full_document_store, sample_documents_with_embeddings):
         full_document_store.write_documents(sample_documents_with_embeddings)
@@ -218,6 +547,108 @@ class TestDjangoModelDocumentStore:
         assert results[0].id == "doc1"
         assert hasattr(results[0], "score")
 
+    def test_embedding_retrieval_l2_distance_squared(
+        self, full_document_store, sample_documents_with_embeddings, monkeypatch
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[0.9, 0.1, 0.0], top_k=2, vector_function=L2Distance
+        )
+        assert "<->" in str(results.query)
+
+        monkeypatch.setattr(FullDocument._haystack, "squared_l2_ranking", True)
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[0.9, 0.1, 0.0], top_k=2, vector_function=L2Distance
+        )
+
+        assert "vector_l2_squared_distance(" in str(results.query)
+        assert [d.id for d in results] == ["doc1", "doc2"]
+        assert [d.score for d in results] == pytest.approx([0.1414, 1.2728], abs=1e-3)
+
+        with CaptureQueriesContext(connection) as captured:
+            batch_results = full_document_store.embedding_retrieval_batch(
+                query_embeddings=[[0.9, 0.1, 0.0]], top_k=2, vector_function=L2Distance
+            )
+
+        assert "vector_l2_squared_distance(" in captured[0]["sql"]
+        assert [d.score for d in batch_results[0]] == pytest.approx([0.1414, 1.2728], abs=1e-3)
+
+    def test_embedding_retrieval_bounded_sort(self, full_document_store):
+        full_document_store.write_documents(
+            [Document(id=f"doc{i}", content="", embedding=[1.0, float(i), 0.0]) for i in range(20)]
+        )
+
+        results = full_document_store.embedding_retrieval(
+            query_embedding=[1.0, 0.0, 0.0], top_k=2, vector_function=L2Distance
+        )
+
+        # Without an index, Postgres keeps only the top_k closest rows while scanning
+        assert "top-N heapsort" in results.explain(analyze=True)
+        assert [d.id for d in results] == ["doc0", "doc1"]
+
+    def test_embedding_retrieval_prepared_statement(self, full_document_store):
+        # A separate connection with the options recommended in the README
+        default_connection = connections["default"]
+        settings_dict = {
+            **default_connection.settings_dict,
+            "OPTIONS": {
+                **default_connection.settings_dict["OPTIONS"],
+                "server_side_binding": True,
+                "prepare_threshold": 2,
+            },
+        }
+        prepared_connection = type(default_connection)(settings_dict, alias="prepared")
+        try:
+            with prepared_connection.cursor() as cursor:
+                for query_embedding in ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.5, 0.5, 0.0]):
+                    queryset = full_document_store.embedding_retrieval(
+                        query_embedding, top_k=2, vector_function=CosineDistance
+                    )
+                    cursor.execute(*queryset.query.sql_with_params())
+                cursor.execute(
+                    "SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE %s",
+                    ['%"testapp_fulldocument"."embedding" <=> $1%'],
+                )
+                assert cursor.fetchone()[0] == 1
+        finally:
+            prepared_connection.close()
+
+    def test_embedding_retrieval_batch(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        with CaptureQueriesContext(connection) as captured:
+            results = full_document_store.embedding_retrieval_batch(
+                query_embeddings=[[0.9, 0.1, 0.0], [0.1, 0.9, 0.0]],
+                top_k=2,
+                vector_function=L2Distance,
+            )
+
+        assert len(captured) == 1
+        assert [[d.id for d in documents] for documents in results] == [
+            ["doc1", "doc2"],
+            ["doc2", "doc1"],
+        ]
+        assert [d.score for d in results[0]] == pytest.approx([0.1414, 1.2728], abs=1e-3)
+        assert results[0][0].meta == {"key1": "value1"}
+        assert results[0][0].embedding == [1.0, 0.0, 0.0]
+
+    def test_embedding_retrieval_batch_with_filters(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        results = full_document_store.embedding_retrieval_batch(
+            query_embeddings=[[0.9, 0.1, 0.0], [0.1, 0.9, 0.0]],
+            filters={"field": "meta__key2", "operator": "==", "value": "value2"},
+            top_k=2,
+        )
+
+        assert [[d.id for d in documents] for documents in results] == [["doc2"], ["doc2"]]
+        assert results[1][0].score == pytest.approx(0.9939, abs=1e-3)
+
     @pytest.mark.django_db
     def test_keyword_retrieval_with_filters(self, document_store, sample_documents):
         document_store.write_documents(sample_documents)
@@ -244,22 +675,39 @@ class TestDjangoModelDocumentStore:
 
 
     @pytest.mark.django_db(transaction=True)
-    def test_embedding_retrieval(self, full_document_store, sample_documents_with_embeddings):
+    def test_embedding_retrieval(
+        self, full_document_store, sample_documents_with_embeddings, max_queries
+    ):
         full_document_store.write_documents(sample_documents_with_embeddings)
 
         # Query vector more similar to doc1
         query_embedding = [0.9, 0.1, 0.0]
 
-        results = full_document_store.embedding_retrieval(
-            query_embedding=query_embedding,
-            top_k=1,
-            vector_function=CosineDistance
-        )
+        with max_queries(1):
+            results = list(
+                full_document_store.embedding_retrieval(
+                    query_embedding=query_embedding,
+                    top_k=1,
+                    vector_function=CosineDistance
+                )
+            )
 
         assert len(results) == 1
         assert results[0].id == "doc1"
         assert hasattr(results[0], "score")
 
+    def test_keyword_retrieval_search_vector_field(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+
+        results = full_document_store.keyword_retrieval(query="content 1", top_k=1)
+
+        sql = str(results.query)
+        assert '"testapp_fulldocument"."search_vector" @@' in sql
+        assert "to_tsvector" not in sql
+        assert [d.id for d in results] == ["doc1"]
+
     def test_keyword_retrieval(self, document_store, sample_documents):
         document_store.write_documents(sample_documents)
 
@@ -0,0 +1,101 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pgvector.django import L2Distance
+
+from django_haystack.retrievers import DjangoModelEmbeddingRetriever, DjangoModelKeywordRetriever
+
+
+@pytest.mark.django_db
+class TestDjangoModelEmbeddingRetriever:
+    def test_run(self, full_document_store, sample_documents_with_embeddings):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelEmbeddingRetriever(document_store=full_document_store)
+
+        documents = retriever.run(query_embedding=[0.9, 0.1, 0.0])["documents"]
+
+        assert [d.id for d in documents] == ["doc1", "doc2"]
+        assert documents[0].score > documents[1].score
+        assert documents[0].content == "test content 1"
+        assert documents[0].meta == {"key1": "value1"}
+        assert documents[0].embedding == [1.0, 0.0, 0.0]
+
+    def test_run_with_vector_function(self, full_document_store, sample_documents_with_embeddings):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelEmbeddingRetriever(
+            document_store=full_document_store, vector_function=L2Distance
+        )
+
+        documents = retriever.run(query_embedding=[0.9, 0.1, 0.0], top_k=1)["documents"]
+
+        assert [d.id for d in documents] == ["doc1"]
+        assert documents[0].score == pytest.approx(0.1414, abs=1e-3)
+
+    def test_run_with_max_distance(self, full_document_store, sample_documents_with_embeddings):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelEmbeddingRetriever(
+            document_store=full_document_store, vector_function=L2Distance, max_distance=0.5
+        )
+
+        documents = retriever.run(query_embedding=[0.9, 0.1, 0.0])["documents"]
+        assert [d.id for d in documents] == ["doc1"]
+
+        documents = retriever.run(query_embedding=[0.9, 0.1, 0.0], max_distance=2.0)["documents"]
+        assert [d.id for d in documents] == ["doc1", "doc2"]
+
+    def test_run_without_search_parameters(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelEmbeddingRetriever(document_store=full_document_store)
+
+        with CaptureQueriesContext(connection) as captured:
+            retriever.run(query_embedding=[0.9, 0.1, 0.0])
+
+        assert len(captured) == 1
+        assert captured[0]["sql"].startswith("SELECT")
+
+    def test_run_with_search_parameters(
+        self, full_document_store, sample_documents_with_embeddings
+    ):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelEmbeddingRetriever(
+            document_store=full_document_store, ef_search=100, probes=5
+        )
+
+        with CaptureQueriesContext(connection) as captured:
+            documents = retriever.run(query_embedding=[0.9, 0.1, 0.0])["documents"]
+
+        assert [d.id for d in documents] == ["doc1", "doc2"]
+        sql = [query["sql"] for query in captured]
+        assert (
+            "SELECT current_setting('hnsw.ef_search', true), "
+            "set_config('hnsw.ef_search', '100', true)"
+        ) in sql
+        assert (
+            "SELECT current_setting('ivfflat.probes', true), set_config('ivfflat.probes', '5', true)"
+        ) in sql
+
+
+@pytest.mark.django_db
+class TestDjangoModelKeywordRetriever:
+    def test_run(self, full_document_store, sample_documents_with_embeddings):
+        full_document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelKeywordRetriever(document_store=full_document_store)
+
+        documents = retriever.run(query="content 1")["documents"]
+
+        assert documents[0].id == "doc1"
+        assert documents[0].score > 0
+        assert documents[0].embedding is None
+
+    def test_run_with_filters(self, document_store, sample_documents_with_embeddings):
+        document_store.write_documents(sample_documents_with_embeddings)
+        retriever = DjangoModelKeywordRetriever(
+            document_store=document_store,
+            filters={"field": "meta__key2", "operator": "==", "value": "value2"},
+        )
+
+        documents = retriever.run(query="content")["documents"]
+
+        assert [d.id for d in documents] == ["doc2"]